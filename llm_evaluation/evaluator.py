@@ -148,8 +148,23 @@ def evaluate_single_attribute(question: str, response: str, expected_answer: str
     return completion.choices[0].message.parsed
 
 class ResponseEvaluator:
-    def __init__(self):
+    def __init__(self, compact: bool = False):
         self.rouge_scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
+        self.compact = compact
+
+    def token_details(self, method, reference_tokens, response_tokens):
+        """Token comparison details, reduced to token counts in compact mode"""
+        if self.compact:
+            return {
+                'method': method,
+                'reference_token_count': len(reference_tokens),
+                'response_token_count': len(response_tokens)
+            }
+        return {
+            'method': method,
+            'reference_tokens': reference_tokens,
+            'response_tokens': response_tokens
+        }
 
     def calculate_bleu(self, reference, response):
         reference_tokens = nltk.word_tokenize(reference.lower())
@@ -162,11 +177,7 @@ class ResponseEvaluator:
         
         return {
             'score': score,
-            'details': {
-                'method': 'BLEU',
-                'reference_tokens': reference_tokens,
-                'response_tokens': response_tokens
-            }
+            'details': self.token_details('BLEU', reference_tokens, response_tokens)
         }
 
     def calculate_rouge(self, reference, response):
@@ -187,11 +198,7 @@ class ResponseEvaluator:
         score = meteor_score([reference_tokens], response_tokens)
         return {
             'score': score,
-            'details': {
-                'method': 'METEOR',
-                'reference_tokens': reference_tokens,
-                'response_tokens': response_tokens
-            }
+            'details': self.token_details('METEOR', reference_tokens, response_tokens)
         }
     
     def llm_judge(self, question: str, response: str, reference: str, context: str = None) -> EvaluationResult:
@@ -292,11 +299,12 @@ def main():
     parser.add_argument('--user-message', required=True, help='Original user message')
     parser.add_argument('--expected', required=True, help='Expected response')
     parser.add_argument('--response', required=True, help='Model response')
+    parser.add_argument('--compact', action='store_true', help='Report token counts instead of token lists')
     
     args = parser.parse_args()
     methods = args.methods.split(',')
     
-    evaluator = ResponseEvaluator()
+    evaluator = ResponseEvaluator(compact=args.compact)
     results = evaluator.evaluate(args.user_message, args.response, args.expected, methods)
     print(json.dumps(results))
 
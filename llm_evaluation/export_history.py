@@ -0,0 +1,132 @@
+import argparse
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+from pandas.api.types import union_categoricals
+from typing import List, Dict, Iterable, Iterator
+
+ATTRIBUTES = [
+    "accuracy",
+    "relevance",
+    "coherence",
+    "ethical_considerations",
+    "professionalism",
+    "reasoning",
+    "creativity"
+]
+CATEGORY_COLUMNS = ["model_implementation", "model_name", "grading_method"]
+COLUMNS = [
+    "id", "test_case_id", "module_id", "system_prompt_id",
+    *CATEGORY_COLUMNS, "overall_score", "created_at", *ATTRIBUTES
+]
+CHUNK_SIZE = 100000
+
+
+def read_history(path: str) -> Iterator[Dict]:
+    """Streams test_results rows from JSON lines, as written by /api/results/export"""
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    with f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _chunk_frame(columns: Dict[str, List]) -> pd.DataFrame:
+    frame = pd.DataFrame(columns, columns=COLUMNS)
+
+    frame["id"] = frame["id"].astype(np.int64)
+    frame["test_case_id"] = frame["test_case_id"].astype(np.int64)
+    frame["module_id"] = frame["module_id"].astype(np.int64)
+    frame["system_prompt_id"] = pd.to_numeric(frame["system_prompt_id"]).fillna(-1).astype(np.int64)
+    for column in CATEGORY_COLUMNS:
+        frame[column] = frame[column].astype("category")
+    for column in ["overall_score", *ATTRIBUTES]:
+        frame[column] = pd.to_numeric(frame[column]).astype(np.float32)
+    frame["created_at"] = pd.to_datetime(frame["created_at"], utc=True).dt.tz_localize(None).astype("datetime64[s]")
+
+    return frame
+
+
+def history_frame(rows: Iterable[Dict], chunk_size: int = CHUNK_SIZE) -> pd.DataFrame:
+    """Builds one row per test result with the overall score and one column per LLM_JUDGE attribute.
+
+    Rows are converted to typed columns every chunk_size rows, so only one chunk of
+    decoded JSON is held in memory at a time.
+    """
+    chunks = []
+    columns = {column: [] for column in COLUMNS}
+    for row in rows:
+        for column, values in columns.items():
+            values.append(row.get(column))
+
+        if len(columns["id"]) == chunk_size:
+            chunks.append(_chunk_frame(columns))
+            columns = {column: [] for column in COLUMNS}
+
+    if columns["id"] or not chunks:
+        chunks.append(_chunk_frame(columns))
+
+    frame = pd.concat([chunk.drop(columns=CATEGORY_COLUMNS) for chunk in chunks], ignore_index=True)
+    for column in CATEGORY_COLUMNS:
+        frame[column] = union_categoricals([chunk[column] for chunk in chunks])
+
+    return frame[COLUMNS]
+
+
+def export_parquet(frame: pd.DataFrame, output: str):
+    try:
+        frame.to_parquet(output, index=False)
+    except ImportError:
+        raise ValueError("Parquet export requires pyarrow, install it with: pip install pyarrow")
+
+
+def export_numpy(frame: pd.DataFrame, output: str):
+    """Writes one .npy file per column, loadable with np.load(path, mmap_mode='r').
+
+    Categorical columns are stored as int32 codes with their categories listed in columns.json,
+    a missing system_prompt_id is stored as -1 and a missing score as NaN.
+    """
+    os.makedirs(output, exist_ok=True)
+    index = {"rows": len(frame), "columns": {}}
+
+    for column in frame.columns:
+        if column in CATEGORY_COLUMNS:
+            values = frame[column].cat.codes.to_numpy().astype(np.int32)
+            index["columns"][column] = {
+                "dtype": str(values.dtype),
+                "categories": [str(category) for category in frame[column].cat.categories]
+            }
+        else:
+            values = frame[column].to_numpy()
+            index["columns"][column] = {"dtype": str(values.dtype)}
+        np.save(os.path.join(output, f"{column}.npy"), values)
+
+    with open(os.path.join(output, "columns.json"), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export evaluation history to a columnar format')
+    parser.add_argument('--input', default='-', help='JSON lines from /api/results/export, - for stdin')
+    parser.add_argument('--output', required=True, help='Parquet file, or directory of .npy columns')
+    parser.add_argument('--format', choices=['parquet', 'npy'], default='npy', help='Output format')
+
+    args = parser.parse_args()
+
+    try:
+        frame = history_frame(read_history(args.input))
+        if args.format == 'parquet':
+            export_parquet(frame, args.output)
+        else:
+            export_numpy(frame, args.output)
+    except Exception as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+        sys.exit(1)
+
+    print(json.dumps({"success": True, "rows": len(frame), "output": args.output}))
+
+if __name__ == '__main__':
+    main()
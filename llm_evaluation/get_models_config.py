@@ -7,11 +7,16 @@ venv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file_
 site_packages = os.path.join(venv_path, 'Lib', 'site-packages')
 sys.path.insert(0, site_packages)
 
-from models import get_models_config
+from model_catalog import get_catalog, refresh_live_models
 
 def main():
     try:
-        configs = get_models_config()
+        if "--refresh-live" in sys.argv[1:]:
+            api_keys = json.loads(sys.stdin.read())
+            refresh_live_models(api_keys)
+            sys.exit(0)
+
+        configs = get_catalog()
         
         print(json.dumps(configs))
         
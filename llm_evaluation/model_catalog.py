@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import time
+
+from typing import List, Dict, Optional
+
+CATALOG_VERSION = 1
+LIVE_MODELS_TTL = 60 * 60
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODELS_PATH = os.path.join(BASE_DIR, 'models.py')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'model_manifest.json')
+LIVE_MODELS_PATH = os.path.join(CACHE_DIR, 'live_models.json')
+
+
+def _manifest_key() -> Dict:
+    return {
+        "version": CATALOG_VERSION,
+        "models_mtime": os.path.getmtime(MODELS_PATH)
+    }
+
+
+def _read_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: str, data: Dict):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def build_manifest() -> Dict:
+    """Builds the model manifest from models.py, which loads every provider SDK"""
+    from models import get_models_config
+
+    return {
+        "key": _manifest_key(),
+        "models": get_models_config()
+    }
+
+
+def live_discovery_enabled() -> bool:
+    return os.getenv('LIVE_MODEL_DISCOVERY', '').lower() == 'true'
+
+
+def load_manifest() -> Dict:
+    """Returns the cached model manifest, rebuilding it when models.py or CATALOG_VERSION changed"""
+    manifest = _read_json(MANIFEST_PATH)
+    if manifest is None or manifest.get("key") != _manifest_key():
+        manifest = build_manifest()
+        try:
+            _write_json(MANIFEST_PATH, manifest)
+        except OSError as e:
+            print(f"Failed to cache model manifest: {str(e)}", file=sys.stderr)
+    return manifest
+
+
+def get_catalog() -> List[Dict]:
+    """Returns the models configuration for the frontend.
+
+    With LIVE_MODEL_DISCOVERY enabled, models listed live by a provider are appended
+    after its curated available_models.
+    """
+    live_models = {}
+    if live_discovery_enabled():
+        live_models = _read_json(LIVE_MODELS_PATH) or {}
+
+    catalog = []
+    for config in load_manifest()["models"]:
+        live = live_models.get(config["name"])
+        if live:
+            curated = config["available_models"]
+            config = {**config, "available_models": curated + [m for m in live["models"] if m not in curated]}
+        catalog.append(config)
+    return catalog
+
+
+def refresh_live_models(api_keys: Dict[str, str], ttl: float = LIVE_MODELS_TTL) -> Dict:
+    """Lists the models of every provider with an API key whose cached listing is older than ttl seconds.
+
+    A failed listing keeps the previous models but still counts as fetched, so an invalid key
+    is retried once per ttl rather than on every call.
+    """
+    live_models = _read_json(LIVE_MODELS_PATH) or {}
+    known_names = {config["name"] for config in load_manifest()["models"]}
+    now = time.time()
+    expired = [
+        name for name, api_key in api_keys.items()
+        if api_key and name in known_names and now - live_models.get(name, {}).get("fetched_at", 0) >= ttl
+    ]
+    if not expired:
+        return live_models
+
+    from models import get_available_implementations
+
+    implementations = {impl.get_model_info().name: impl for impl in get_available_implementations()}
+    for name in expired:
+        models = live_models.get(name, {}).get("models", [])
+        try:
+            models = implementations[name].list_models(api_keys[name])
+        except Exception as e:
+            print(f"Failed to list models for {name}: {str(e)}", file=sys.stderr)
+
+        live_models[name] = {
+            "fetched_at": now,
+            "models": models
+        }
+
+    _write_json(LIVE_MODELS_PATH, live_models)
+    return live_models
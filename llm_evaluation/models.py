@@ -24,6 +24,10 @@ class LLMImplementation(ABC):
     def generate_response(self, api_key: Optional[str], system_prompt:  Optional[str], user_prompt: str, model: str) -> str:
         pass
 
+    def list_models(self, api_key: Optional[str]) -> List[str]:
+        """Returns the models currently offered by the provider, defaults to the static list"""
+        return self.get_model_info().available_models
+
 class OpenAIImplementation(LLMImplementation):
     def get_model_info(self) -> ModelInfo:
         return ModelInfo(
@@ -56,6 +60,17 @@ class OpenAIImplementation(LLMImplementation):
         )
         return chat_completion.choices[0].message.content
 
+    def list_models(self, api_key: Optional[str]) -> List[str]:
+        # Model families that are not served by chat.completions
+        unsupported = {"instruct", "realtime", "audio", "transcribe", "tts", "image", "search", "pro", "codex", "research"}
+
+        client = OpenAI(api_key=api_key)
+        return sorted(
+            model.id for model in client.models.list()
+            if model.id.startswith(("gpt-", "chatgpt-", "o1", "o3", "o4"))
+            and not unsupported.intersection(model.id.split("-"))
+        )
+
 class AnthropicImplementation(LLMImplementation):
     def get_model_info(self) -> ModelInfo:
         return ModelInfo(
@@ -93,6 +108,10 @@ class AnthropicImplementation(LLMImplementation):
 
         message = client.messages.create(**kwargs)
         return message.content[0].text
+
+    def list_models(self, api_key: Optional[str]) -> List[str]:
+        client = anthropic.Anthropic(api_key=api_key)
+        return [model.id for model in client.models.list()]
     
 class GeminiImplementation(LLMImplementation):
     def get_model_info(self) -> ModelInfo:
@@ -123,6 +142,13 @@ class GeminiImplementation(LLMImplementation):
         )
         
         return response.text
+
+    def list_models(self, api_key: Optional[str]) -> List[str]:
+        client = genai.Client(api_key=api_key)
+        return [
+            model.name.removeprefix("models/") for model in client.models.list()
+            if "generateContent" in (model.supported_actions or [])
+        ]
     
 class LocalLLMImplementation(LLMImplementation):
     def get_model_info(self) -> ModelInfo:
@@ -147,15 +173,15 @@ def get_available_implementations() -> List[LLMImplementation]:
 
 def get_models_config() -> List[Dict]:
     """Returns configuration for all available models in a format suitable for the frontend"""
-    implementations = get_available_implementations()
+    model_infos = [impl.get_model_info() for impl in get_available_implementations()]
     return [
         {
-            "name": impl.get_model_info().name,
-            "requires_api_key": impl.get_model_info().requires_api_key,
-            "available_models": impl.get_model_info().available_models,
-            "description": impl.get_model_info().description
+            "name": info.name,
+            "requires_api_key": info.requires_api_key,
+            "available_models": info.available_models,
+            "description": info.description
         }
-        for impl in implementations
+        for info in model_infos
     ]
 
 def generate_model_response(implementation_name: str, api_key: Optional[str], system_prompt: str, user_prompt: str, model: str) -> str:
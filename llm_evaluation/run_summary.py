@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from typing import List, Dict, Optional
+
+HISTOGRAM_BINS = 10
+QUANTILES = [0.1, 0.5, 0.9]
+NO_SYSTEM_PROMPT = "none"
+
+
+def _is_error(evaluation: Dict) -> bool:
+    details = evaluation.get("details")
+    return isinstance(details, dict) and "error" in details
+
+
+def _score_frame(results: List[Dict], system_prompts: Dict[str, Optional[int]]) -> pd.DataFrame:
+    """Flattens the evaluation results of a run into one row per score, skipping failed evaluations"""
+    rows = []
+    for result in results:
+        system_prompt_id = system_prompts.get(str(result["test_case_id"]))
+        system_prompt = NO_SYSTEM_PROMPT if system_prompt_id is None else str(system_prompt_id)
+
+        for method, evaluation in result["evaluation_result"].items():
+            if _is_error(evaluation):
+                continue
+
+            rows.append((system_prompt, "methods", method, evaluation["score"]))
+
+            if method == "LLM_JUDGE":
+                for attribute, attribute_score in evaluation["details"]["attributes"].items():
+                    rows.append((system_prompt, "attributes", attribute, attribute_score["score"]))
+
+    frame = pd.DataFrame(rows, columns=["system_prompt", "kind", "name", "score"])
+    frame["score"] = frame["score"].astype(np.float64)
+    return frame
+
+
+def _aggregate(frame: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """Computes count, mean, std, quantiles and histogram counts for every group of keys"""
+    grouped = frame.groupby(keys, sort=True)["score"]
+
+    stats = pd.DataFrame({
+        "count": grouped.count(),
+        "mean": grouped.mean(),
+        "std": grouped.std(ddof=0)
+    })
+
+    quantiles = grouped.quantile(QUANTILES).unstack()
+    stats["p10"] = quantiles[0.1]
+    stats["median"] = quantiles[0.5]
+    stats["p90"] = quantiles[0.9]
+
+    bins = np.minimum(
+        (frame["score"].clip(0.0, 1.0).to_numpy() * HISTOGRAM_BINS).astype(np.int64),
+        HISTOGRAM_BINS - 1
+    )
+    histogram = (
+        frame.assign(bin=bins)
+        .groupby(keys + ["bin"], sort=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=range(HISTOGRAM_BINS), fill_value=0)
+    )
+    stats["histogram"] = histogram.to_numpy().tolist()
+
+    return stats
+
+
+def _stats_to_dict(stats: pd.DataFrame) -> Dict:
+    return {
+        "count": int(stats["count"]),
+        "mean": float(stats["mean"]),
+        "median": float(stats["median"]),
+        "p10": float(stats["p10"]),
+        "p90": float(stats["p90"]),
+        "std": float(stats["std"]),
+        "histogram": [int(count) for count in stats["histogram"]]
+    }
+
+
+def summarize_results(results: List[Dict], system_prompts: Dict[str, Optional[int]]) -> Dict:
+    """Returns run-level score statistics per grading method and LLM_JUDGE attribute,
+    overall and broken down per system prompt.
+
+    `results` are serialized TestResult dicts and `system_prompts` maps each test case id
+    to the id of the system prompt it ran with. Scores are bucketed into HISTOGRAM_BINS
+    equal-width bins over [0, 1]. Failed test cases and evaluations that reported an error
+    are left out of the statistics. failed_test_count counts test cases that raised before
+    being evaluated, failed_evaluation_count counts grading method evaluations of the
+    remaining test cases that reported an error.
+    """
+    summary = {
+        "result_count": len(results),
+        "failed_test_count": sum(1 for result in results if result.get("error")),
+        "failed_evaluation_count": sum(
+            _is_error(evaluation)
+            for result in results
+            for evaluation in result["evaluation_result"].values()
+        ),
+        "histogram_edges": np.linspace(0.0, 1.0, HISTOGRAM_BINS + 1).round(6).tolist(),
+        "methods": {},
+        "attributes": {},
+        "system_prompts": {}
+    }
+
+    frame = _score_frame(results, system_prompts)
+    if frame.empty:
+        return summary
+
+    for (kind, name), stats in _aggregate(frame, ["kind", "name"]).iterrows():
+        summary[kind][name] = _stats_to_dict(stats)
+
+    for (system_prompt, kind, name), stats in _aggregate(frame, ["system_prompt", "kind", "name"]).iterrows():
+        breakdown = summary["system_prompts"].setdefault(system_prompt, {"methods": {}, "attributes": {}})
+        breakdown[kind][name] = _stats_to_dict(stats)
+
+    return summary
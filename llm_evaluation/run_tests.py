@@ -5,6 +5,7 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from models import generate_model_response
 from evaluator import ResponseEvaluator
+from run_summary import summarize_results
 
 # Print virtual environment information
 #print("Python executable:", sys.executable)
@@ -17,6 +18,7 @@ class TestCase:
     expected_response: str
     system_prompt: Optional[str] = None
     context: Optional[str] = None
+    system_prompt_id: Optional[int] = None
 
 @dataclass
 class TestResult:
@@ -42,7 +44,8 @@ def run_single_test(
     model_implementation: str,
     specific_model: str,
     api_key: str,
-    grading_methods: List[str]
+    grading_methods: List[str],
+    compact: bool = False
 ) -> TestResult:
     try:
         model_response = generate_model_response(
@@ -53,7 +56,7 @@ def run_single_test(
             model=specific_model
         )
         
-        evaluator = ResponseEvaluator()
+        evaluator = ResponseEvaluator(compact=compact)
         evaluation = evaluator.evaluate(
             question=test_case.prompt,
             response=model_response,
@@ -102,24 +105,27 @@ def run_single_test(
                                 "score": float(result.creativity.score),
                                 "explanation": result.creativity.explanation
                             }
-                        },
-                        "responses": {
-                            "input": test_case.prompt,
-                            "llm_response": model_response,
-                            "reference_response": test_case.expected_response
                         }
                     }
                 }
+                # The prompt, response and reference are already carried by the TestResult
+                if not compact:
+                    evaluation_dict[method]["details"]["responses"] = {
+                        "input": test_case.prompt,
+                        "llm_response": model_response,
+                        "reference_response": test_case.expected_response
+                    }
             else:
                 score = result['score'] if isinstance(result, dict) else result.score
                 evaluation_dict[method] = {
                     "score": float(score),
-                    "model_response": model_response,
                     "details": result['details'] if isinstance(result, dict) else result.details
                 }
+                if not compact:
+                    evaluation_dict[method]["model_response"] = model_response
             
             print(f"\n{method} Score: {evaluation_dict[method]['score']:.3f}", file=sys.stderr)
-            if method == "BLEU" and "details" in evaluation_dict[method]:
+            if method == "BLEU" and "reference_tokens" in evaluation_dict[method].get("details", {}):
                 print("Token comparison:", file=sys.stderr)
                 print(f"  Reference: {evaluation_dict[method]['details']['reference_tokens']}", file=sys.stderr)
                 print(f"  Response:  {evaluation_dict[method]['details']['response_tokens']}", file=sys.stderr)
@@ -155,7 +161,8 @@ def run_all_tests(
     model_implementation: str,
     specific_model: str,
     api_key: str,
-    grading_methods: List[str]
+    grading_methods: List[str],
+    compact: bool = False
 ) -> List[TestResult]:
     results = []
     for test_case in test_cases:
@@ -164,7 +171,8 @@ def run_all_tests(
             model_implementation=model_implementation,
             specific_model=specific_model,
             api_key=api_key,
-            grading_methods=grading_methods
+            grading_methods=grading_methods,
+            compact=compact
         )
         results.append(result)
     return results
@@ -179,6 +187,7 @@ def main():
         specific_model = input_data["specific_model"]
         api_key = input_data["api_key"]
         grading_methods = input_data["grading_methods"]
+        compact = input_data.get("compact", False)
         
     except Exception as e:
         print(json.dumps({
@@ -193,14 +202,25 @@ def main():
             model_implementation=model_implementation,
             specific_model=specific_model,
             api_key=api_key,
-            grading_methods=grading_methods
+            grading_methods=grading_methods,
+            compact=compact
         )
         
         results_json = [r.to_dict() for r in results]
         
+        try:
+            summary = summarize_results(
+                results_json,
+                {str(tc.id): tc.system_prompt_id for tc in test_cases}
+            )
+        except Exception as e:
+            print(f"Failed to summarize results: {str(e)}", file=sys.stderr)
+            summary = None
+        
         print(json.dumps({
             "success": True,
-            "results": results_json
+            "results": results_json,
+            "summary": summary
         }))
         sys.exit(0)
         
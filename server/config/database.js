@@ -70,6 +70,29 @@ export async function getConnection() {
   return connection;
 }
 
+// Tables added after the initial schema, created on startup for existing installs
+const UPGRADE_STATEMENTS = [
+  `CREATE TABLE IF NOT EXISTS \`test_run_summaries\` (
+    \`id\` int(11) NOT NULL AUTO_INCREMENT,
+    \`module_id\` int(11) NOT NULL,
+    \`model_implementation\` varchar(50) NOT NULL,
+    \`model_name\` varchar(50) NOT NULL,
+    \`result_count\` int(11) NOT NULL,
+    \`summary\` longtext CHARACTER SET utf8mb4 COLLATE utf8mb4_bin DEFAULT NULL CHECK (json_valid(\`summary\`)),
+    \`created_at\` timestamp NULL DEFAULT current_timestamp(),
+    PRIMARY KEY (\`id\`),
+    KEY \`module_id\` (\`module_id\`),
+    CONSTRAINT \`test_run_summaries_ibfk_1\` FOREIGN KEY (\`module_id\`) REFERENCES \`modules\` (\`id\`) ON DELETE CASCADE
+  ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci`
+];
+
+export async function upgradeTables() {
+  const conn = await getConnection();
+  for (const statement of UPGRADE_STATEMENTS) {
+    await conn.query(statement);
+  }
+}
+
 export async function createTables() {
   try {
     const conn = await getConnection();
@@ -139,6 +139,22 @@ CREATE TABLE `test_results` (
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `test_run_summaries`
+--
+
+CREATE TABLE `test_run_summaries` (
+  `id` int(11) NOT NULL,
+  `module_id` int(11) NOT NULL,
+  `model_implementation` varchar(50) NOT NULL,
+  `model_name` varchar(50) NOT NULL,
+  `result_count` int(11) NOT NULL,
+  `summary` longtext CHARACTER SET utf8mb4 COLLATE utf8mb4_bin DEFAULT NULL CHECK (json_valid(`summary`)),
+  `created_at` timestamp NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `test_runs`
 --
@@ -220,6 +236,13 @@ ALTER TABLE `test_results`
   ADD KEY `module_id` (`module_id`),
   ADD KEY `system_prompt_id` (`system_prompt_id`);
 
+--
+-- Indexes for table `test_run_summaries`
+--
+ALTER TABLE `test_run_summaries`
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `module_id` (`module_id`);
+
 --
 -- Indexes for table `test_runs`
 --
@@ -280,6 +303,12 @@ ALTER TABLE `test_cases`
 ALTER TABLE `test_results`
   MODIFY `id` int(11) NOT NULL AUTO_INCREMENT;
 
+--
+-- AUTO_INCREMENT for table `test_run_summaries`
+--
+ALTER TABLE `test_run_summaries`
+  MODIFY `id` int(11) NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT for table `test_runs`
 --
@@ -330,6 +359,12 @@ ALTER TABLE `test_results`
   ADD CONSTRAINT `test_results_ibfk_2` FOREIGN KEY (`module_id`) REFERENCES `modules` (`id`) ON DELETE CASCADE,
   ADD CONSTRAINT `test_results_ibfk_3` FOREIGN KEY (`system_prompt_id`) REFERENCES `system_prompts` (`id`) ON DELETE SET NULL;
 
+--
+-- Constraints for table `test_run_summaries`
+--
+ALTER TABLE `test_run_summaries`
+  ADD CONSTRAINT `test_run_summaries_ibfk_1` FOREIGN KEY (`module_id`) REFERENCES `modules` (`id`) ON DELETE CASCADE;
+
 --
 -- Constraints for table `test_runs`
 --
@@ -17,6 +17,7 @@ import testRunsRouter from './routes/test-runs.js';
 import { checkInstallation } from './middleware/installation.js';
 import { authenticateToken } from './middleware/auth.js';
 import modelsRouter from './routes/models.js';
+import { upgradeTables } from './config/database.js';
 
 dotenv.config();
 
@@ -30,7 +31,7 @@ async function loadEncryptedConfig() {
     
     if (!exists) {
       console.log('No config file found. This is expected for first-time setup.');
-      return;
+      return false;
     }
     
     const config = JSON.parse(await fs.readFile(configPath, 'utf-8'));
@@ -39,8 +40,10 @@ async function loadEncryptedConfig() {
         process.env[key] = value.toString();
       }
     });
+    return true;
   } catch (error) {
     console.error('Error loading encrypted config:', error);
+    return false;
   }
 }
 
@@ -51,7 +54,13 @@ app.use(cors());
 app.use(express.json());
 
 // Load encrypted config before setting up routes
-await loadEncryptedConfig();
+if (await loadEncryptedConfig()) {
+  try {
+    await upgradeTables();
+  } catch (error) {
+    console.error('Error upgrading database tables:', error);
+  }
+}
 
 // Public routes
 app.use('/api/install', installRoutes);
@@ -10,13 +10,60 @@ const router = express.Router();
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
+const modelsConfigScript = path.join(__dirname, '../../llm_evaluation/get_models_config.py');
+
+// Live model listings are cached for an hour by the Python side, this only throttles the spawns
+const LIVE_MODELS_REFRESH_INTERVAL = 60 * 60 * 1000;
+let lastLiveModelsRefresh = 0;
+
+const refreshLiveModels = async () => {
+    const now = Date.now();
+    if (process.env.LIVE_MODEL_DISCOVERY !== 'true' || now - lastLiveModelsRefresh < LIVE_MODELS_REFRESH_INTERVAL) {
+        return;
+    }
+    lastLiveModelsRefresh = now;
+
+    const connection = await getConnection();
+    const [rows] = await connection.query(
+        `SELECT m.name, k.encrypted_key, k.iv
+         FROM models m
+         JOIN model_api_keys k ON k.model_id = m.id
+         WHERE k.encrypted_key <> '' AND k.iv <> ''`
+    );
+
+    const apiKeys = {};
+    for (const row of rows) {
+        apiKeys[row.name] = await decrypt(row.iv + ':' + row.encrypted_key);
+    }
+
+    if (Object.keys(apiKeys).length === 0) {
+        return;
+    }
+
+    const pythonProcess = spawn('python', [modelsConfigScript, '--refresh-live']);
+
+    // Runs after the response was sent, so unhandled errors here would crash the server
+    pythonProcess.on('error', (error) => {
+        console.error('Error starting live models refresh:', error);
+    });
+
+    pythonProcess.stdin.on('error', (error) => {
+        console.error('Error sending API keys to live models refresh:', error);
+    });
+
+    pythonProcess.stderr.on('data', (data) => {
+        console.error(`Python Error: ${data}`);
+    });
+
+    pythonProcess.stdin.write(JSON.stringify(apiKeys));
+    pythonProcess.stdin.end();
+};
+
 router.use(authenticateToken);
 
 router.get('/config', async (req, res) => {
     try {
-        const pythonProcess = spawn('python', [
-            path.join(__dirname, '../../llm_evaluation/get_models_config.py')
-        ]);
+        const pythonProcess = spawn('python', [modelsConfigScript]);
 
         let result = '';
 
@@ -77,6 +124,10 @@ router.get('/config', async (req, res) => {
                 }
                 
                 res.json(config);
+
+                refreshLiveModels().catch((error) => {
+                    console.error('Error refreshing live models:', error);
+                });
             } catch (error) {
                 res.status(500).json({ error: 'Failed to parse models configuration' });
             }
@@ -361,17 +361,27 @@ router.post('/:id/run-tests', authenticateToken, async (req, res) => {
       );
     }
 
+    // The system prompt each test case runs with, recorded on its results and in the run summary
+    const systemPrompts = new Map(testCases.map(tc => [
+      String(tc.id),
+      tc.system_prompt_content
+        ? { id: tc.system_prompt_id || null, content: tc.system_prompt_content }
+        : { id: module.system_prompt_id || null, content: module.system_prompt_content || null }
+    ]));
+
     const pythonInput = {
       test_cases: testCases.map(tc => ({
         id: tc.id,
         prompt: tc.prompt,
         expected_response: tc.expected_response,
-        system_prompt: tc.system_prompt_content || module.system_prompt_content || null
+        system_prompt: systemPrompts.get(String(tc.id)).content,
+        system_prompt_id: systemPrompts.get(String(tc.id)).id
       })),
       model_implementation: implementation,
       specific_model: model,
       api_key: decryptedKey,
-      grading_methods: gradingMethods.map(gm => gm.grading_method)
+      grading_methods: gradingMethods.map(gm => gm.grading_method),
+      compact: true
     };
 
     const isWindows = process.platform === 'win32';
@@ -409,6 +419,7 @@ router.post('/:id/run-tests', authenticateToken, async (req, res) => {
           }
 
           for (const result of results.results) {
+            const systemPrompt = systemPrompts.get(String(result.test_case_id));
             for (const [method, evaluation] of Object.entries(result.evaluation_result)) {
               await connection.execute(
                 'UPDATE test_runs SET status = ? WHERE test_case_id = ? AND grading_method = ?',
@@ -433,11 +444,10 @@ router.post('/:id/run-tests', authenticateToken, async (req, res) => {
                     method,
                     evaluation.score,
                     JSON.stringify({
-                      attributes: evaluation.details.attributes,
-                      responses: evaluation.details.responses
+                      attributes: evaluation.details.attributes
                     }),
-                    module.system_prompt_id || null,
-                    module.system_prompt_content || null
+                    systemPrompt.id,
+                    systemPrompt.content
                   ]
                 );
               } else {
@@ -458,13 +468,32 @@ router.post('/:id/run-tests', authenticateToken, async (req, res) => {
                     method,
                     evaluation.score,
                     JSON.stringify(evaluation.details),
-                    module.system_prompt_id || null,
-                    module.system_prompt_content || null
+                    systemPrompt.id,
+                    systemPrompt.content
                   ]
                 );
               }
             }
           }
+
+          if (results.summary) {
+            try {
+              await connection.execute(
+                `INSERT INTO test_run_summaries 
+                 (module_id, model_implementation, model_name, result_count, summary) 
+                 VALUES (?, ?, ?, ?, ?)`,
+                [
+                  moduleId,
+                  implementation,
+                  model,
+                  results.summary.result_count,
+                  JSON.stringify(results.summary)
+                ]
+              );
+            } catch (error) {
+              console.error('Error storing run summary:', error);
+            }
+          }
         } else {
           for (const runId of testRunIds) {
             await connection.execute(
@@ -43,6 +43,104 @@ router.get('/', async (req, res) => {
   }
 });
 
+// Get pre-aggregated run summaries, all of them unless a limit is given
+router.get('/summaries', async (req, res) => {
+  try {
+    const connection = await getConnection();
+    const limit = parseInt(req.query.limit, 10);
+    const [summaries] = await connection.query(`
+      SELECT 
+        trs.id,
+        trs.module_id,
+        trs.model_implementation,
+        trs.model_name,
+        trs.result_count,
+        trs.summary,
+        trs.created_at,
+        m.name as module_name
+      FROM test_run_summaries trs
+      LEFT JOIN modules m ON trs.module_id = m.id
+      ORDER BY trs.created_at DESC
+      ${limit > 0 ? 'LIMIT ?' : ''}
+    `, limit > 0 ? [limit] : []);
+
+    res.json(summaries);
+  } catch (error) {
+    console.error('Error fetching run summaries:', error);
+    res.status(500).json({ error: 'Failed to fetch run summaries' });
+  }
+});
+
+const EXPORT_ATTRIBUTES = [
+  'accuracy',
+  'relevance',
+  'coherence',
+  'ethical_considerations',
+  'professionalism',
+  'reasoning',
+  'creativity'
+];
+const EXPORT_BATCH_SIZE = 10000;
+
+// Stream score columns of all test results as JSON lines for export_history.py
+router.get('/export', async (req, res) => {
+  try {
+    const connection = await getConnection();
+    const attributeColumns = EXPORT_ATTRIBUTES
+      .map(attr => `JSON_VALUE(tr.attribute_scores, '$.attributes.${attr}.score') as ${attr}`)
+      .join(',\n        ');
+
+    res.setHeader('Content-Type', 'application/x-ndjson');
+
+    let lastId = 0;
+    while (!res.destroyed) {
+      const [rows] = await connection.query(`
+        SELECT 
+          tr.id,
+          tr.test_case_id,
+          tr.module_id,
+          tr.system_prompt_id,
+          tr.model_implementation,
+          tr.model_name,
+          tr.grading_method,
+          tr.overall_score,
+          tr.created_at,
+          ${attributeColumns}
+        FROM test_results tr
+        WHERE tr.id > ?
+        ORDER BY tr.id
+        LIMIT ?
+      `, [lastId, EXPORT_BATCH_SIZE]);
+
+      if (rows.length === 0) {
+        break;
+      }
+
+      if (!res.write(rows.map(row => JSON.stringify(row)).join('\n') + '\n')) {
+        await new Promise(resolve => {
+          const done = () => {
+            res.off('drain', done);
+            res.off('close', done);
+            resolve();
+          };
+          res.on('drain', done);
+          res.on('close', done);
+        });
+      }
+      lastId = rows[rows.length - 1].id;
+    }
+
+    res.end();
+  } catch (error) {
+    console.error('Error exporting test results:', error);
+    if (res.headersSent) {
+      res.end();
+    } else {
+      res.status(500).json({ error: 'Failed to export test results' });
+    }
+  }
+});
+
 // Get details for a specific test result
 router.get('/:id', async (req, res) => {
   try {
@@ -131,6 +131,16 @@ export const getResults = async () => {
   }
 };
 
+export const getResultSummaries = async (limit) => {
+  try {
+    const response = await api.get('/results/summaries', { params: { limit } });
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching run summaries:', error);
+    throw error;
+  }
+};
+
 // Modules
 export const getModules = async () => {
   try {
@@ -1,10 +1,11 @@
 import React from 'react'
 import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import { getDashboardStats } from '../../api';
+import { getDashboardStats, getResultSummaries } from '../../api';
 
 export function Dashboard() {
   const [stats, setStats] = useState(null);
+  const [latestRun, setLatestRun] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [retryCount, setRetryCount] = useState(0);
@@ -15,8 +16,18 @@ export function Dashboard() {
 
   const fetchDashboardStats = async () => {
     try {
-      const data = await getDashboardStats();
+      const [data, summaries] = await Promise.all([
+        getDashboardStats(),
+        getResultSummaries(1).catch(() => [])
+      ]);
       setStats(data);
+      if (summaries.length > 0) {
+        const run = summaries[0];
+        setLatestRun({
+          ...run,
+          summary: typeof run.summary === 'string' ? JSON.parse(run.summary) : run.summary
+        });
+      }
       setError(null);
     } catch (error) {
       console.error('Error fetching dashboard stats:', error);
@@ -192,6 +203,50 @@ export function Dashboard() {
         </div>
       )}
 
+      {/* Latest Run Summary */}
+      {latestRun?.summary && Object.keys(latestRun.summary.methods).length > 0 && (
+        <div className="mb-8">
+          <h2 className="text-2xl font-bold mb-4 dark:text-white">Latest Run</h2>
+          <p className="text-sm text-gray-500 dark:text-gray-400 mb-4">
+            {latestRun.module_name} · {latestRun.model_name} · {latestRun.result_count} test cases · {new Date(latestRun.created_at).toLocaleString()}
+          </p>
+          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-4">
+            {Object.entries(latestRun.summary.methods).map(([method, methodStats]) => (
+              <div key={method} className="bg-white dark:bg-gray-800 p-6 rounded-lg border border-gray-200 dark:border-gray-700 hover:shadow-lg transition-shadow">
+                <h3 className="text-lg font-semibold text-gray-800 dark:text-white mb-4">
+                  {method === 'LLM_JUDGE' ? 'LLM JUDGE' : method}
+                </h3>
+                <div className="grid grid-cols-2 gap-2 text-sm">
+                  <div className="text-gray-500 dark:text-gray-400">Mean</div>
+                  <div className="text-gray-900 dark:text-white">{methodStats.mean.toFixed(2)}</div>
+                  <div className="text-gray-500 dark:text-gray-400">Median</div>
+                  <div className="text-gray-900 dark:text-white">{methodStats.median.toFixed(2)}</div>
+                  <div className="text-gray-500 dark:text-gray-400">P10 / P90</div>
+                  <div className="text-gray-900 dark:text-white">{methodStats.p10.toFixed(2)} / {methodStats.p90.toFixed(2)}</div>
+                  <div className="text-gray-500 dark:text-gray-400">Std Dev</div>
+                  <div className="text-gray-900 dark:text-white">{methodStats.std.toFixed(2)}</div>
+                </div>
+              </div>
+            ))}
+          </div>
+          {Object.keys(latestRun.summary.attributes).length > 0 && (
+            <div className="mt-4 bg-white dark:bg-gray-800 p-6 rounded-lg border border-gray-200 dark:border-gray-700">
+              <h3 className="text-lg font-semibold text-gray-800 dark:text-white mb-4">LLM Judge Attributes</h3>
+              <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+                {Object.entries(latestRun.summary.attributes).map(([attr, attrStats]) => (
+                  <div key={attr}>
+                    <div className="text-sm text-gray-500 dark:text-gray-400">
+                      {attr.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase())}
+                    </div>
+                    <div className="text-xl font-bold text-gray-900 dark:text-white">{attrStats.mean.toFixed(2)}</div>
+                  </div>
+                ))}
+              </div>
+            </div>
+          )}
+        </div>
+      )}
+
       {/* Recent Activity */}
       {stats?.recentRuns && stats.recentRuns.length > 0 && (
         <div className="mb-8">
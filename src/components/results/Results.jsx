@@ -1,8 +1,9 @@
 import React, { useState, useEffect } from 'react';
-import { getResults } from '../../api';
+import { getResults, getResultSummaries } from '../../api';
 
 export function Results() {
   const [results, setResults] = useState([]);
+  const [summaries, setSummaries] = useState([]);
   const [loading, setLoading] = useState(true);
   const [selectedModel, setSelectedModel] = useState(null);
   const [expandedModules, setExpandedModules] = useState(new Set());
@@ -16,9 +17,16 @@ export function Results() {
 
   const fetchResults = async () => {
     try {
-      const data = await getResults();
+      const [data, summaryRows] = await Promise.all([
+        getResults(),
+        getResultSummaries().catch(() => [])
+      ]);
       //console.log('Fetched results:', data);
       setResults(data);
+      setSummaries(summaryRows.map(row => ({
+        ...row,
+        summary: typeof row.summary === 'string' ? JSON.parse(row.summary) : row.summary
+      })));
     } catch (error) {
       //console.error('Error fetching results:', error);
     } finally {
@@ -90,6 +98,30 @@ export function Results() {
     return formatScore(average);
   };
 
+  // Count-weighted mean of the stored run summaries, null when they do not account for every result row
+  const calculateSummaryAverageScore = (runSummaries, resultCount) => {
+    let total = 0;
+    let scoreCount = 0;
+    let coveredCount = 0;
+    for (const { summary } of runSummaries) {
+      for (const methodStats of Object.values(summary.methods)) {
+        total += methodStats.mean * methodStats.count;
+        scoreCount += methodStats.count;
+      }
+      coveredCount += summary.failed_evaluation_count || 0;
+    }
+    coveredCount += scoreCount;
+
+    if (runSummaries.length === 0 || coveredCount !== resultCount) return null;
+    if (scoreCount === 0) return 'N/A';
+    return formatScore(total / scoreCount);
+  };
+
+  const getAverageScore = (groupResults, matchesSummary) => {
+    const summaryAverage = calculateSummaryAverageScore(summaries.filter(matchesSummary), groupResults.length);
+    return summaryAverage ?? calculateAverageScore(groupResults);
+  };
+
   const groupedResults = results.reduce((acc, result) => {
     const key = `${result.model_implementation}-${result.model_name}`;
     if (!acc[key]) {
@@ -145,10 +177,17 @@ export function Results() {
             </div>
             <div>
               <div className="font-medium mb-2 dark:text-gray-200">Token Comparison:</div>
-              <div className="space-y-1 font-mono text-sm dark:text-gray-300">
-                <div>Reference: [{evaluation.details.reference_tokens.map(token => `'${token}'`).join(', ')}]</div>
-                <div>Response:  [{evaluation.details.response_tokens.map(token => `'${token}'`).join(', ')}]</div>
-              </div>
+              {evaluation.details.reference_tokens ? (
+                <div className="space-y-1 font-mono text-sm dark:text-gray-300">
+                  <div>Reference: [{evaluation.details.reference_tokens.map(token => `'${token}'`).join(', ')}]</div>
+                  <div>Response:  [{evaluation.details.response_tokens.map(token => `'${token}'`).join(', ')}]</div>
+                </div>
+              ) : (
+                <div className="space-y-1 font-mono text-sm dark:text-gray-300">
+                  <div>Reference: {evaluation.details.reference_token_count} tokens</div>
+                  <div>Response:  {evaluation.details.response_token_count} tokens</div>
+                </div>
+              )}
             </div>
           </div>
         );
@@ -209,7 +248,10 @@ export function Results() {
                 {Object.entries(groupedResults).map(([modelKey, modelResults]) => {
                   const [implementation, ...nameParts] = modelKey.split('-');
                   const name = nameParts.join('-');
-                  const averageScore = calculateAverageScore(modelResults);
+                  const averageScore = getAverageScore(
+                    modelResults,
+                    run => `${run.model_implementation}-${run.model_name}` === modelKey
+                  );
                   
                   return (
                     <button
@@ -247,6 +289,11 @@ export function Results() {
                 }, {});
 
                 return Object.entries(moduleGroups).map(([moduleKey, moduleResults]) => {
+                  const moduleAverageScore = getAverageScore(
+                    moduleResults,
+                    run => `${run.model_implementation}-${run.model_name}` === selectedModel &&
+                      run.module_id === moduleResults[0].module_id
+                  );
                   const testCaseGroups = moduleResults.reduce((acc, result) => {
                     const key = result.test_case_id;
                     if (!acc[key]) {
@@ -268,7 +315,7 @@ export function Results() {
                             {moduleResults[0].module_name}
                           </h3>
                           <div className="text-sm text-gray-600 dark:text-gray-400">
-                            Average Score: <span className={getScoreColor(calculateAverageScore(moduleResults))}>{calculateAverageScore(moduleResults)}</span>
+                            Average Score: <span className={getScoreColor(moduleAverageScore)}>{moduleAverageScore}</span>
                           </div>
                         </div>
                         <span className="text-gray-400">